@@ -1,49 +1,145 @@
 """API client for ZKHNSO integration."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import operator
 import re
-from datetime import datetime
 from typing import Any
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode
 
 import aiohttp
+from yarl import URL
 
 from .const import (
     API_BASE_URL,
-    API_URL_LOGIN,
-    API_URL_MAIN,
-    API_URL_METERS,
-    API_URL_TARIFFS,
-    API_URL_PREFLIGHT,
     SESSION_FORM_TOKEN,
     SESSION_JSESSIONID,
+    URL_LOGIN,
+    URL_MAIN,
+    URL_METERS,
+    URL_PREFLIGHT,
+    URL_TARIFFS,
 )
-from .html_parser import extract_table_rows_with_children, html_to_json_simple
+from .html_parser import extract_login_token, extract_table_rows_with_children
 
 _LOGGER = logging.getLogger(__name__)
 
+_BASE_URL = URL(API_BASE_URL)
+
+# Login token input of the server-rendered login form, either attribute order
+_LOGIN_TOKEN_RE = re.compile(
+    rb'\sname="loginToken"[^>]*\svalue="([^"]+)"'
+    rb'|\svalue="([^"]+)"[^>]*\sname="loginToken"'
+)
+
+# Present only on the login page, which the portal serves once the session expired
+_LOGIN_FORM_MARKER = 'id="loginForm"'
+
+# Strips (non-breaking) spaces and turns decimal commas into dots
+_NUM_TRANS = str.maketrans({" ": "", "\u00a0": "", ",": "."})
+
+_SERIAL_RE = re.compile(r"[^0-9]")
+
+# Cells used from meter rows: type name, serial number, units, value date,
+# value and next verification date
+_METER_CELLS = operator.itemgetter(0, 1, 2, 3, 4, 8)
+# Cells used from tariff rows: name, norm, units, tariff and date
+_TARIFF_CELLS = operator.itemgetter(0, 1, 2, 3, 4)
+
+# Headers for pages of the logged-in area
+_PAGE_HEADERS = {"Referer": URL_MAIN}
+
+# Russian unit names to standard symbols of HASS
+_UNIT_MAP = {
+    "кв.м": "m²",
+    "куб.м.": "m³",
+    "кВтч": "kWh",
+    "Гкал": "Gcal",
+}
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session tuned for the portal: one host, a few concurrent requests.
+
+    The caller owns the returned session and must close it.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=4,
+            limit_per_host=4,
+            keepalive_timeout=75,
+            ttl_dns_cache=3600,
+        ),
+        # Unquoted like the hand-built Cookie headers the portal was used with
+        cookie_jar=aiohttp.CookieJar(quote_cookie=False),
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
+def _decode_html(response: aiohttp.ClientResponse, body: bytes) -> str:
+    """Decode a response body with the charset declared in Content-Type.
+
+    Skips aiohttp's charset detection, the portal always declares its encoding.
+    """
+    return body.decode(response.charset or "utf-8", errors="replace")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_ddmmyyyy(date_str: str) -> str | None:
+    """Convert a DD.MM.YYYY date string to ISO format, or None if invalid."""
+    date_str = date_str.strip()
+    if len(date_str) != 10 or date_str[2] != "." or date_str[5] != ".":
+        return None
+
+    day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+
+    return f"{year}-{month}-{day}"
+
 
 class ZKHAPIClient:
     """Client for interacting with ZKHNSO API."""
 
-    def __init__(self, username: str, password: str) -> None:
-        """Initialize the API client."""
+    def __init__(
+        self, username: str, password: str, session: aiohttp.ClientSession
+    ) -> None:
+        """Initialize the API client.
+
+        The session is owned by the caller and is reused across requests,
+        so the client never creates or closes it.
+        """
         self.username = username
         self.password = password
-        self.session: aiohttp.ClientSession | None = None
-        self.jsessionid: str | None = None
+        self.session = session
         self.form_token: str | None = None
+        self._login_body: str | None = None
+        self._login_lock = asyncio.Lock()
+        # Bumped on every successful login, lets concurrent requests share one re-login
+        self._login_generation = 0
+
+        # Static cookies expected by the portal; JSESSIONID is tracked by the
+        # session's cookie jar from Set-Cookie headers.
+        self.session.cookie_jar.update_cookies(
+            {"userLogin": username, "loginModule": "lk"}, response_url=_BASE_URL
+        )
+
+    @property
+    def jsessionid(self) -> str | None:
+        """Return the JSESSIONID currently stored in the session cookie jar."""
+        morsel = self.session.cookie_jar.filter_cookies(_BASE_URL).get(
+            SESSION_JSESSIONID
+        )
+        return morsel.value if morsel else None
 
     async def __aenter__(self) -> ZKHAPIClient:
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
 
     async def preflight(self) -> dict[str, str] | None:
         """Perform preflight request to get FORM_TOKEN and JSESSIONID.
@@ -51,10 +147,7 @@ class ZKHAPIClient:
         Returns:
             Dictionary with JSESSIONID and FORM_TOKEN, or None on error
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = urljoin(API_BASE_URL, API_URL_PREFLIGHT)
+        url = URL_PREFLIGHT
 
         try:
             async with self.session.get(url) as response:
@@ -64,28 +157,40 @@ class ZKHAPIClient:
                     )
                     return None
 
-                # Extract JSESSIONID from Set-Cookie header
-                jsessionid = self._extract_jsessionid(response.headers)
+                jsessionid = self.jsessionid
                 if not jsessionid:
-                    _LOGGER.warning("JSESSIONID not found in response headers: %s", response.headers)
-
-                # Get HTML content
-                html_content = await response.text()
+                    _LOGGER.warning("JSESSIONID cookie not set by preflight response")
 
-                # Extract FORM_TOKEN from HTML
-                form_token = html_to_json_simple(
-                    html_content,
-                    "#loginForm input[name=loginToken]",
-                    attribute="value",
-                )
+                # Extract FORM_TOKEN from raw HTML, parse the page only if that fails
+                body = await response.read()
+                match = _LOGIN_TOKEN_RE.search(body)
+                if match:
+                    form_token = (match.group(1) or match.group(2)).decode()
+                else:
+                    form_token = extract_login_token(_decode_html(response, body))
 
                 if not form_token:
                     _LOGGER.error("FORM_TOKEN not found in HTML response")
                     return None
 
-                self.jsessionid = jsessionid
                 self.form_token = form_token
 
+                # Only the token changes between logins, encode the form once here
+                self._login_body = urlencode(
+                    {
+                        "struts.token.name": "loginToken",
+                        "loginToken": form_token,
+                        "userName": self.username,
+                        "userPass": self.password,
+                        "captchaCode": "x",
+                        "timezone": "-420",
+                        "loginModule": "lk",
+                    },
+                    doseq=False,
+                    encoding="utf-8",
+                    safe="",
+                )
+
                 _LOGGER.debug(
                     "Preflight successful: JSESSIONID=%s, FORM_TOKEN=%s",
                     jsessionid[:20] + "..." if jsessionid and len(jsessionid) > 20 else jsessionid,
@@ -104,96 +209,26 @@ class ZKHAPIClient:
             _LOGGER.exception("Unexpected error during preflight: %s", e)
             return None
 
-    def _extract_jsessionid(self, headers: Any) -> str | None:
-        """Extract JSESSIONID from Set-Cookie header.
-
-        Args:
-            headers: Response headers object
-
-        Returns:
-            JSESSIONID value or None if not found
-        """
-        cookies = headers.getall("Set-Cookie", [])
-        for cookie in cookies:
-            if "JSESSIONID=" in cookie:
-                # Extract JSESSIONID value
-                # Format: JSESSIONID=value; Path=/; ...
-                parts = cookie.split(";")
-                for part in parts:
-                    part = part.strip()
-                    if part.startswith("JSESSIONID="):
-                        return part.split("=", 1)[1]
-        return None
-
-    def _get_authenticated_cookies(self) -> dict[str, str]:
-        """Get cookies for authenticated requests (includes userLogin and loginModule)."""
-        cookies = {
-            "userLogin": self.username,
-            "loginModule": "lk",
-        }
-        if self.jsessionid:
-            cookies["JSESSIONID"] = self.jsessionid
-        return cookies
-
-    def _build_login_cookie_header(self) -> str:
-        """Build cookie header for login request using JSESSIONID from preflight."""
-        if not self.jsessionid:
-            return ""
-        return f"JSESSIONID={self.jsessionid};"
-
-    def _build_cookie_header(self, cookies: dict[str, str]) -> str:
-        """Build a Cookie header string from cookies dictionary."""
-        parts = [
-            f"{key}={value}"
-            for key, value in cookies.items()
-            if value is not None
-        ]
-        return ("; ".join(parts) + ";") if parts else ""
-
-
     async def login(self) -> bool:
         """Perform login after preflight.
 
         Returns:
             True if login successful, False otherwise
         """
-        if not self.form_token or not self.jsessionid:
+        if not self._login_body or not self.jsessionid:
             _LOGGER.error("Preflight must be called before login")
             return False
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = urljoin(API_BASE_URL, API_URL_LOGIN)
-        preflight_url = urljoin(API_BASE_URL, API_URL_PREFLIGHT)
-
-        # Prepare form data
-        form_payload = urlencode(
-            {
-                "struts.token.name": "loginToken",
-                "loginToken": self.form_token,
-                "userName": self.username,
-                "userPass": self.password,
-                "captchaCode": "x",
-                "timezone": "-420",
-                "loginModule": "lk",
-            },
-            doseq=False,
-            encoding="utf-8",
-            safe="",
-        )
+        url = URL_LOGIN
+        form_payload = self._login_body
 
         # Prepare headers
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
             "Origin": API_BASE_URL,
-            "Referer": preflight_url,
+            "Referer": URL_PREFLIGHT,
         }
 
-        login_cookie = self._build_login_cookie_header()
-        if login_cookie:
-            headers["Cookie"] = login_cookie
-
         _LOGGER.debug("Login request headers: %s", headers)
         _LOGGER.debug("Login form payload: %s", form_payload)
 
@@ -201,18 +236,13 @@ class ZKHAPIClient:
             async with self.session.post(
                 url, data=form_payload, headers=headers
             ) as response:
-                # Extract updated JSESSIONID from response
-                updated_jsessionid = self._extract_jsessionid(response.headers)
-                if updated_jsessionid:
-                    self.jsessionid = updated_jsessionid
-                    _LOGGER.debug("JSESSIONID updated after login: %s", updated_jsessionid)
-                else:
-                    _LOGGER.warning("JSESSIONID not found in response headers: %s", response.headers)
+                _LOGGER.debug("JSESSIONID after login: %s", self.jsessionid)
 
                 # Check if login was successful
                 # Typically, successful login returns 200 or redirects
                 if response.status in (200, 302):
                     _LOGGER.debug("Login successful with status %d", response.status)
+                    self._login_generation += 1
                     return True
                 else:
                     _LOGGER.error(
@@ -233,6 +263,61 @@ class ZKHAPIClient:
             _LOGGER.exception("Unexpected error during login to url %s: %s", url, e)
             return False
 
+    async def _relogin(self, expired_generation: int) -> bool:
+        """Perform preflight and login again after the session expired.
+
+        Concurrent requests share one re-login: if a login succeeded since
+        the expired request was sent, nothing is done. The JSESSIONID cannot
+        be used for this, the portal's login page hands out a new one.
+
+        Args:
+            expired_generation: Login generation the expired request was sent with
+
+        Returns:
+            True if a valid session is available, False otherwise
+        """
+        async with self._login_lock:
+            if self._login_generation != expired_generation:
+                return True
+
+            _LOGGER.debug("Session expired, logging in again")
+            self.session.cookie_jar.clear(
+                lambda morsel: morsel.key == SESSION_JSESSIONID
+            )
+            return bool(await self.preflight()) and await self.login()
+
+    async def _get_authenticated_page(self, url: str, name: str) -> str | None:
+        """Fetch a page of the logged-in area, logging in again once if needed.
+
+        An expired session is detected by a 401 status or by the portal
+        answering with its login page.
+
+        Args:
+            url: Page URL
+            name: Page name for log messages
+
+        Returns:
+            Page HTML, or None on error
+        """
+        for attempt in range(2):
+            generation = self._login_generation
+            async with self.session.get(url, headers=_PAGE_HEADERS) as response:
+                if response.status == 200:
+                    html_content = _decode_html(response, await response.read())
+                    if _LOGIN_FORM_MARKER not in html_content:
+                        return html_content
+                elif response.status != 401:
+                    _LOGGER.error(
+                        "%s request to url %s failed with status %d", name, url, response.status
+                    )
+                    return None
+
+            if attempt or not await self._relogin(generation):
+                break
+
+        _LOGGER.error("%s request to url %s failed: session expired", name, url)
+        return None
+
     async def get_tariffs(self) -> dict[str, Any] | None:
         """Fetch tariffs data.
 
@@ -255,42 +340,13 @@ class ZKHAPIClient:
             _LOGGER.error("Must be logged in to fetch tariffs")
             return None
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = urljoin(API_BASE_URL, API_URL_TARIFFS)
-        referer_url = urljoin(API_BASE_URL, API_URL_MAIN)
-
-        cookies = self._get_authenticated_cookies()
-        cookie_header = self._build_cookie_header(cookies)
-
-        # Prepare headers
-        headers = {
-            "Cookie": cookie_header,
-            "Referer": referer_url,
-        }
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Tariffs request to url %s failed with status %d", url, response.status
-                    )
-                    return None
+            html_content = await self._get_authenticated_page(URL_TARIFFS, "Tariffs")
+            if html_content is None:
+                return None
 
-                html_content = await response.text()
-
-                # Extract table rows
-                rows = extract_table_rows_with_children(
-                    html_content, "#tariffsForm table tr"
-                )
-
-                if not rows:
-                    _LOGGER.warning("No table rows found in url %s (headers: %s) tariffs", url, headers)
-                    return {"tariffs": {}}
-
-                # Process rows into tariffs data
-                return self._process_tariffs_data(rows)
+            # Parsing is CPU-bound, keep it off the event loop
+            return await asyncio.to_thread(self._parse_tariffs_page, html_content)
 
         except aiohttp.ClientError as e:
             _LOGGER.error("Error during tariffs request: %s", e)
@@ -299,22 +355,19 @@ class ZKHAPIClient:
             _LOGGER.exception("Unexpected error during tariffs fetch: %s", e)
             return None
 
-    def _parse_date(self, date_str: str, format_in: str = "%d.%m.%Y") -> str | None:
+    def _parse_date(self, date_str: str) -> str | None:
         """Parse date string and convert to ISO format (YYYY-MM-DD).
 
         Args:
-            date_str: Date string to parse
-            format_in: Input date format (default: DD.MM.YYYY)
+            date_str: Date string to parse (DD.MM.YYYY)
 
         Returns:
             ISO format date string (YYYY-MM-DD) or None on error
         """
-        try:
-            dt = datetime.strptime(date_str.strip(), format_in)
-            return dt.strftime("%Y-%m-%d")
-        except (ValueError, AttributeError) as e:
-            _LOGGER.warning("Failed to parse date '%s': %s", date_str, e)
-            return None
+        date = _parse_ddmmyyyy(date_str) if isinstance(date_str, str) else None
+        if date is None:
+            _LOGGER.warning("Failed to parse date '%s'", date_str)
+        return date
 
     def _sanitize_serial_number(self, serial: str) -> str:
         """Sanitize serial number for use as key (replace non-digits with underscore).
@@ -325,46 +378,83 @@ class ZKHAPIClient:
         Returns:
             Sanitized serial number
         """
-        return re.sub(r"[^0-9]", "_", serial)
+        return _SERIAL_RE.sub("_", serial)
+
+    def _parse_meters_page(self, html_content: str) -> dict[str, Any]:
+        """Extract and process the meters table of a page (runs in a worker thread).
+
+        Args:
+            html_content: Meters page HTML
+
+        Returns:
+            Dictionary with meters and max date
+        """
+        rows = extract_table_rows_with_children(
+            html_content, "#countersForm table tr", skip_header=True
+        )
+
+        if rows is None:
+            _LOGGER.warning("No table rows found in url %s meters", URL_METERS)
+            return {"meters": {}, "date": None}
+
+        return self._process_meters_data(rows)
+
+    def _parse_tariffs_page(self, html_content: str) -> dict[str, Any]:
+        """Extract and process the tariffs table of a page (runs in a worker thread).
+
+        Args:
+            html_content: Tariffs page HTML
+
+        Returns:
+            Dictionary with tariffs data
+        """
+        rows = extract_table_rows_with_children(
+            html_content, "#tariffsForm table tr", skip_header=True
+        )
+
+        if rows is None:
+            _LOGGER.warning("No table rows found in url %s tariffs", URL_TARIFFS)
+            return {"tariffs": {}}
+
+        return self._process_tariffs_data(rows)
 
     def _process_meters_data(self, rows: list[list[str]]) -> dict[str, Any]:
         """Process table rows into meters data structure (similar to JQ transformation).
 
         Args:
-            rows: List of table rows, where each row is a list of cell text values
+            rows: List of table data rows (header excluded), where each row is a
+                list of stripped cell text values
 
         Returns:
             Dictionary with meters and max date
         """
-        if not rows or len(rows) < 2:
+        if not rows:
             return {"meters": {}, "date": None}
 
-        # Skip first row (header) - [1:]
-        data_rows = rows[1:]
         meters = {}
-        dates = []
+        max_date = None
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        for row in data_rows:
-            _LOGGER.debug("Row: %s", row)
+        for row in rows:
             if len(row) < 6:
                 _LOGGER.warning("Row has insufficient columns: %s", row)
                 continue
 
             try:
-                # Extract data from row cells
-                # [0] - type name
-                # [1] - serial number
-                # [2] - units of measurement
-                # [3] - value date (DD.MM.YYYY)
-                # [4] - value (number)
-                # [8] - next verification date (DD.MM.YYYY)
-                type_name = row[0].strip()
-                serial_number = row[1].strip()
-                units = row[2].strip()
-                value_date_str = row[3].strip()
-                value_str = row[4].strip()
-                next_verification_date_str = row[8].strip()
-                _LOGGER.debug("METER Type: %s, Units: %s, Serial №: %s, Date: %s, Value: %s, Next V: %s", type_name, units, serial_number, value_date_str, value_str, next_verification_date_str)
+                # Dates are DD.MM.YYYY, value is a number
+                (
+                    type_name,
+                    serial_number,
+                    units,
+                    value_date_str,
+                    value_str,
+                    next_verification_date_str,
+                ) = _METER_CELLS(row)
+                if debug:
+                    _LOGGER.debug(
+                        "METER Type: %s, Units: %s, Serial №: %s, Date: %s, Value: %s, Next V: %s",
+                        type_name, units, serial_number, value_date_str, value_str, next_verification_date_str,
+                    )
 
                 # Parse value as number and floor it
                 try:
@@ -373,98 +463,75 @@ class ZKHAPIClient:
                     _LOGGER.warning("Failed to parse value '%s' as number", value_str)
                     value = 0
 
-                # Parse dates
-                value_date = self._parse_date(value_date_str)
-                next_verification_date = self._parse_date(next_verification_date_str)
-
-                if value_date:
-                    dates.append(value_date)
-
-                # Create meter object
                 meter = {
                     "name": f"{type_name} №{serial_number}",
                     "units": units,
                     "serial_number": serial_number,
                     "type_name": type_name,
                     "value": value,
-                    "value_date": value_date,
-                    "next_verification_date": next_verification_date,
+                    "value_date": self._parse_date(value_date_str),
+                    "next_verification_date": self._parse_date(
+                        next_verification_date_str
+                    ),
                 }
 
-                _LOGGER.debug("Meter: %s", meter)
+                if debug:
+                    _LOGGER.debug("Meter: %s", meter)
 
                 # Use sanitized serial number as key
-                key = self._sanitize_serial_number(serial_number)
-                meters[key] = meter
+                meters[self._sanitize_serial_number(serial_number)] = meter
+
+                # Over every row, a meter overwritten by a repeated key still counts
+                if meter["value_date"]:
+                    max_date = max(max_date or "", meter["value_date"])
 
             except (IndexError, AttributeError) as e:
                 _LOGGER.warning("Error processing row %s: %s", row, e)
                 continue
 
-        # Find max date
-        max_date = max(dates) if dates else None
-
         return {"meters": meters, "date": max_date}
 
     def _process_tariffs_data(self, rows: list[list[str]]) -> dict[str, Any]:
         """Process table rows into tariffs data structure (similar to JQ transformation).
 
         Args:
-            rows: List of table rows, where each row is a list of cell text values
+            rows: List of table data rows (header excluded), where each row is a
+                list of stripped cell text values
 
         Returns:
             Dictionary with tariffs data
         """
-        if not rows or len(rows) < 2:
+        if not rows:
             return {"tariffs": {}}
 
-        # Skip first row (header) - [1:]
-        data_rows = rows[1:]
         tariffs = {}
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        for row in data_rows:
+        for row in rows:
             if len(row) < 5:
                 _LOGGER.warning("Tariff row has insufficient columns: %s", row)
                 continue
 
             try:
-                # Extract data from row cells based on JQ logic
-                # [0] - name
-                # [1] - norm
-                # [2] - units of measurement
-                # [3] - tariff
-                # [4] - date (DD.MM.YYYY)
-                name = row[0].strip()
-                norm = row[1].strip()
-                units = row[2].strip()
-                tariff_value = row[3].strip()
-                date_str = row[4].strip()
-
-                _LOGGER.debug("TARIFF Name: %s, Norm %s, Unit: %s, Tariff: %s, Date: %s",
-                            name, norm, units, tariff_value, date_str)
-
-                # Parse rate (remove spaces, convert comma to dot)
-                norm = self._extract_norm(norm)
-
-                # Map Russian units to standard symbols
-                unit = self._map_unit(units)
-
-                # Parse tariff (remove spaces, convert comma to dot)
-                tariff = self._extract_tariff(tariff_value)
-
-                # Parse date
-                date = self._parse_date(date_str)
-
-                # Create tariff object
+                # Date is DD.MM.YYYY
+                name, norm, units, tariff_value, date_str = _TARIFF_CELLS(row)
+
+                if debug:
+                    _LOGGER.debug(
+                        "TARIFF Name: %s, Norm %s, Unit: %s, Tariff: %s, Date: %s",
+                        name, norm, units, tariff_value, date_str,
+                    )
+
                 tariff_obj = {
                     "name": name,
-                    "rate": norm,
-                    "unit": unit,
-                    "tariff": tariff,
-                    "date": date,
+                    "rate": self._parse_ru_number(norm),
+                    "unit": self._map_unit(units),
+                    "tariff": self._parse_ru_number(tariff_value),
+                    "date": self._parse_date(date_str),
                 }
 
-                _LOGGER.debug("Processed tariff: %s", tariff_obj)
+                if debug:
+                    _LOGGER.debug("Processed tariff: %s", tariff_obj)
 
                 # Use name as key
                 tariffs[name] = tariff_obj
@@ -475,44 +542,22 @@ class ZKHAPIClient:
 
         return {"tariffs": tariffs}
 
-    def _extract_norm(self, norm_str: str) -> float | None:
-        """Extract and parse rate from string.
-
-        Args:
-            norm_str: Norm string (may contain spaces and commas)
-
-        Returns:
-            Parsed rate as float or None on error
-        """
-        if not norm_str:
-            return None
-
-        try:
-            # Remove spaces and convert comma to dot
-            cleaned = norm_str.replace(" ", "").replace(",", ".")
-            return float(cleaned)
-        except (ValueError, TypeError) as e:
-            _LOGGER.warning("Failed to parse norm '%s': %s", norm_str, e)
-            return None
-
-    def _extract_tariff(self, tariff_str: str) -> float | None:
-        """Extract and parse tariff from string.
+    def _parse_ru_number(self, number_str: str) -> float | None:
+        """Parse a number in Russian notation (spaces as separators, decimal comma).
 
         Args:
-            tariff_str: Tariff string (may contain spaces and commas)
+            number_str: Number string (may contain spaces and commas)
 
         Returns:
-            Parsed tariff as float or None on error
+            Parsed number as float or None on error
         """
-        if not tariff_str:
+        if not number_str:
             return None
 
         try:
-            # Remove spaces and convert comma to dot
-            cleaned = tariff_str.replace(" ", "").replace(",", ".")
-            return float(cleaned)
+            return float(number_str.translate(_NUM_TRANS))
         except (ValueError, TypeError) as e:
-            _LOGGER.warning("Failed to parse tariff '%s': %s", tariff_str, e)
+            _LOGGER.warning("Failed to parse number '%s': %s", number_str, e)
             return None
 
     def _map_unit(self, unit_str: str) -> str:
@@ -524,14 +569,7 @@ class ZKHAPIClient:
         Returns:
             Mapped unit string
         """
-        unit_mapping = {
-            "кв.м": "m²",
-            "куб.м.": "m³",
-            "кВтч": "kWh",
-            "Гкал": "Gcal",
-        }
-
-        return unit_mapping.get(unit_str, unit_str)
+        return _UNIT_MAP.get(unit_str, unit_str)
 
     async def get_meters(self) -> dict[str, Any] | None:
         """Fetch meters/counters data.
@@ -558,48 +596,13 @@ class ZKHAPIClient:
             _LOGGER.error("Must be logged in to fetch meters")
             return None
 
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        url = urljoin(API_BASE_URL, API_URL_METERS)
-        referer_url = urljoin(API_BASE_URL, API_URL_MAIN)
-
-        cookies = self._get_authenticated_cookies()
-        cookie_header = self._build_cookie_header(cookies)
-
-        # Prepare headers
-        headers = {
-            "Cookie": cookie_header,
-            "Referer": referer_url,
-        }
-
-        _LOGGER.debug(
-            "Meters request prepared with headers=%s and cookie_header=%s",
-            headers,
-            cookie_header,
-        )
-
         try:
-            async with self.session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Meters request to url %s failed with status %d", url, response.status
-                    )
-                    return None
+            html_content = await self._get_authenticated_page(URL_METERS, "Meters")
+            if html_content is None:
+                return None
 
-                html_content = await response.text()
-
-                # Extract table rows
-                rows = extract_table_rows_with_children(
-                    html_content, "#countersForm table tr"
-                )
-
-                if not rows:
-                    _LOGGER.warning("No table rows found in url %s (headers: %s) meters", url, headers)
-                    return {"meters": {}, "date": None}
-
-                # Process rows into meters data
-                return self._process_meters_data(rows)
+            # Parsing is CPU-bound, keep it off the event loop
+            return await asyncio.to_thread(self._parse_meters_page, html_content)
 
         except aiohttp.ClientError as e:
             _LOGGER.error("Error during meters request: %s", e)
@@ -608,3 +611,25 @@ class ZKHAPIClient:
             _LOGGER.exception("Unexpected error during meters fetch: %s", e)
             return None
 
+    async def get_all(self) -> dict[str, dict[str, Any] | None]:
+        """Fetch meters and tariffs data concurrently.
+
+        Both requests share the logged-in session and do not depend on each
+        other, so they run in parallel.
+
+        Returns:
+            Dictionary with "meters" and "tariffs" keys holding the results of
+            get_meters() and get_tariffs() respectively (None on error)
+        """
+        meters_data, tariffs_data = await asyncio.gather(
+            self.get_meters(), self.get_tariffs(), return_exceptions=True
+        )
+
+        if isinstance(meters_data, Exception):
+            _LOGGER.error("Error during meters fetch: %s", meters_data)
+            meters_data = None
+        if isinstance(tariffs_data, Exception):
+            _LOGGER.error("Error during tariffs fetch: %s", tariffs_data)
+            tariffs_data = None
+
+        return {"meters": meters_data, "tariffs": tariffs_data}
@@ -1,4 +1,5 @@
 """Constants for the ZKHNSO integration."""
+from urllib.parse import urljoin
 
 DOMAIN = "zkhnso"
 
@@ -10,6 +11,13 @@ API_URL_TARIFFS = "tariffs.action"
 API_URL_METERS = "counters.action"
 API_URL_MAIN = "main.action"
 
+# Absolute URLs, resolved once at import
+URL_PREFLIGHT = urljoin(API_BASE_URL, API_URL_PREFLIGHT)
+URL_LOGIN = urljoin(API_BASE_URL, API_URL_LOGIN)
+URL_TARIFFS = urljoin(API_BASE_URL, API_URL_TARIFFS)
+URL_METERS = urljoin(API_BASE_URL, API_URL_METERS)
+URL_MAIN = urljoin(API_BASE_URL, API_URL_MAIN)
+
 # Configuration keys
 CONF_API_KEY = "api_key"
 CONF_USERNAME = "username"
@@ -1,205 +1,200 @@
-"""HTML parser utility for converting HTML responses to JSON using CSS selectors.
+"""HTML parser utility for extracting data from the portal pages.
 
 Example usage:
 
-    # Simple extraction
-    value = html_to_json_simple(html, "div.title", "text")
-    
-    # Complex nested extraction
-    config = {
-        "selector": "table.meters",
-        "multiple": True,
-        "children": {
-            "id": {"selector": "td.id", "attribute": "text"},
-            "value": {"selector": "td.value", "attribute": "text"},
-            "unit": {"selector": "td.unit", "attribute": "text"}
-        }
-    }
-    meters = html_to_json(html, config)
+    # Login token of the login form
+    token = extract_login_token(html)
+
+    # Table rows as lists of cell texts
+    rows = extract_table_rows_with_children(html, "#countersForm table tr")
 """
 from __future__ import annotations
 
+from html import unescape
 import logging
-from typing import Any
+import re
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 _LOGGER = logging.getLogger(__name__)
 
+_CELL_TAGS = frozenset(("td", "th"))
+_VOID_TAGS = frozenset(
+    ("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+     "source", "track", "wbr")
+)
+
+_TR_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.DOTALL | re.IGNORECASE)
+_CELL_RE = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.DOTALL | re.IGNORECASE)
+_TR_OPEN_RE = re.compile(r"<tr\b", re.IGNORECASE)
+_CELL_OPEN_RE = re.compile(r"<t[dh]\b", re.IGNORECASE)
+_TAG_RE = re.compile(r"<(/?)(\w*)[^>]*>")
 
-def html_to_json(
-    html_content: str,
-    selector_config: dict[str, Any],
-) -> dict[str, Any] | list[dict[str, Any]] | None:
-    """Convert HTML content to JSON using CSS selectors.
+
+def extract_login_token(html_content: str) -> str | None:
+    """Extract the login token from the login form.
 
     Args:
-        html_content: The HTML content to parse
-        selector_config: Configuration dict with CSS selectors and extraction rules.
-                        Format:
-                        {
-                            "selector": "css.selector",
-                            "attribute": "attr_name" (optional, defaults to text),
-                            "multiple": True/False (optional, defaults to False),
-                            "children": {...} (optional, for nested structures)
-                        }
+        html_content: The login page HTML
 
     Returns:
-        Dictionary, list of dictionaries, or None if no matches found
+        Login token value, or None if not found
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        return _extract_data(soup, selector_config)
+        node = LexborHTMLParser(html_content).css_first(
+            "#loginForm input[name=loginToken]"
+        )
+        return node.attributes.get("value") if node else None
     except Exception as e:
-        _LOGGER.error("Error parsing HTML: %s", e)
+        _LOGGER.error("Error extracting login token: %s", e)
         return None
 
 
-def _extract_data(
-    element: BeautifulSoup | Any,
-    config: dict[str, Any],
-) -> dict[str, Any] | list[dict[str, Any]] | str | None:
-    """Recursively extract data from HTML element based on config."""
-    selector = config.get("selector")
-    if not selector:
-        return None
+def extract_table_rows_with_children(
+    html_content: str, selector: str, skip_header: bool = False
+) -> list[list[str]] | None:
+    """Extract table rows and their children (td elements) as text.
 
-    attribute = config.get("attribute", "text")
-    multiple = config.get("multiple", False)
-    children = config.get("children")
+    Args:
+        html_content: The HTML content to parse
+        selector: CSS selector for table rows (e.g., "#countersForm table tr")
+        skip_header: Whether to drop the first matched row (default: False)
 
+    Returns:
+        List of rows, where each row is a list of cell text values (empty if
+        the table only has a header), or None if no rows matched or on error
+    """
     try:
-        if multiple:
-            elements = element.select(selector)
-            if not elements:
-                return []
-
-            if children:
-                # Multiple elements with nested structure
-                return [
-                    _extract_children(elem, children) for elem in elements if elem
-                ]
-            else:
-                # Multiple simple elements
-                return [
-                    _get_attribute_value(elem, attribute) for elem in elements if elem
-                ]
-        else:
-            elem = element.select_one(selector)
-            if not elem:
-                return None
-
-            if children:
-                # Single element with nested structure
-                return _extract_children(elem, children)
-            else:
-                # Single simple element
-                return _get_attribute_value(elem, attribute)
+        fragment = _slice_table_fragment(html_content, selector)
+
+        # The tables are server-rendered with a regular shape, so a sliced
+        # fragment is tokenized with regexes; the DOM parser is the fallback.
+        result = _extract_rows_regex(fragment) if fragment is not None else None
+        if not result:
+            result = _extract_rows_dom(html_content, fragment, selector)
+
+        if not result:
+            return None
+        if skip_header:
+            result = result[1:]
+
+        _LOGGER.debug("Parsed rows: %s", result)
+        return result
     except Exception as e:
-        _LOGGER.error("Error extracting data with selector '%s': %s", selector, e)
+        _LOGGER.error("Error extracting table rows: %s", e)
         return None
 
 
-def _extract_children(
-    element: Any,
-    children_config: dict[str, Any],
-) -> dict[str, Any]:
-    """Extract nested data from element based on children config."""
-    result = {}
+def _extract_rows_regex(fragment: str) -> list[list[str]] | None:
+    """Tokenize table rows and cells of an HTML fragment without building a tree.
 
-    for key, child_config in children_config.items():
-        if isinstance(child_config, dict):
-            result[key] = _extract_data(element, child_config)
-        else:
-            # Simple string selector
-            result[key] = _extract_data(element, {"selector": child_config})
+    Returns None if any row does not tokenize cleanly, e.g. omitted optional
+    closing tags or nested tables, so the caller can parse the DOM instead.
+    """
+    rows = _TR_RE.findall(fragment)
+    if len(rows) != len(_TR_OPEN_RE.findall(fragment)):
+        return None
 
+    result = []
+    for row in rows:
+        cells = _CELL_RE.findall(row)
+        if len(cells) != len(_CELL_OPEN_RE.findall(row)):
+            return None
+        result.append([_extract_cell_html_text(cell) for cell in cells])
     return result
 
 
-def _get_attribute_value(element: Any, attribute: str) -> str | None:
-    """Get attribute value from element."""
-    if attribute == "text":
-        return element.get_text(strip=True)
-    elif attribute == "html":
-        return str(element)
-    else:
-        return element.get(attribute)
+def _extract_rows_dom(
+    html_content: str, fragment: str | None, selector: str
+) -> list[list[str]]:
+    """Extract table rows by parsing the fragment, or the whole page if needed."""
+    rows = LexborHTMLParser(fragment).css(selector) if fragment is not None else []
+    if not rows:
+        rows = LexborHTMLParser(html_content).css(selector)
 
+    # Cells are direct children of the row, no need to search descendants
+    return [
+        [_extract_cell_text(node) for node in row.iter() if node.tag in _CELL_TAGS]
+        for row in rows
+    ]
 
-def html_to_json_simple(
-    html_content: str,
-    selector: str,
-    attribute: str = "text",
-    multiple: bool = False,
-) -> str | list[str] | None:
-    """Simple wrapper for extracting single selector values.
 
-    Args:
-        html_content: The HTML content to parse
-        selector: CSS selector string
-        attribute: Attribute to extract (default: "text")
-        multiple: Whether to extract multiple matches (default: False)
+def _slice_table_fragment(html_content: str, selector: str) -> str | None:
+    """Cut the page down to the element the selector starts at.
 
-    Returns:
-        String, list of strings, or None
+    Only selectors anchored on an id (e.g. "#countersForm table tr") can be
+    sliced; None is returned when the anchor element or its closing tag is
+    not found.
     """
-    config = {
-        "selector": selector,
-        "attribute": attribute,
-        "multiple": multiple,
-    }
-    result = html_to_json(html_content, config)
-    return result if result is not None else ([] if multiple else None)
-
-
-def extract_table_rows_with_children(
-    html_content: str, selector: str
-) -> list[list[str]] | None:
-    """Extract table rows and their children (td elements) as text.
-
-    Args:
-        html_content: The HTML content to parse
-        selector: CSS selector for table rows (e.g., "#countersForm table tr")
+    if not selector.startswith("#"):
+        return None
 
-    Returns:
-        List of rows, where each row is a list of cell text values, or None on error
-    """
-    try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        rows = soup.select(selector)
-        if not rows:
-            return None
+    element_id = selector[1:].split(" ", 1)[0]
+    anchor = html_content.find(f'id="{element_id}"')
+    if anchor < 0:
+        return None
 
-        _LOGGER.debug("Soup rows: %s", rows)
+    # Include the anchor element's own start tag so the selector still matches
+    start = html_content.rfind("<", 0, anchor)
+    tag = _TAG_RE.match(html_content, start) if start >= 0 else None
+    if tag is None or tag.group(1) or not tag.group(2):
+        return None
 
-        result = []
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            row_data = [_extract_cell_text(cell) for cell in cells]
-            _LOGGER.debug("Row data: %s", row_data)
-            result.append(row_data)
+    # Find the matching closing tag, counting nested elements of the same name
+    tag_re = re.compile(rf"<(/?){re.escape(tag.group(2))}\b[^>]*>", re.IGNORECASE)
+    depth = 0
+    for match in tag_re.finditer(html_content, start):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return html_content[start : match.end()]
 
-        return result
-    except Exception as e:
-        _LOGGER.error("Error extracting table rows: %s", e)
-        return None
+    return None
 
 
-def _extract_cell_text(cell) -> str:
+def _extract_cell_text(cell: LexborNode | None) -> str:
     """Extract text from table cell ignoring nested element contents."""
     if cell is None:
         return ""
 
-    direct_text_parts: list[str] = []
-    for content in cell.contents:
-        if isinstance(content, str):
-            text = content.strip()
-            if text:
-                direct_text_parts.append(text)
+    # Whitespace-only text nodes still contribute a separator, drop them
+    direct_text = " ".join(
+        filter(None, cell.text(deep=False, separator="\x1f", strip=True).split("\x1f"))
+    )
+    if direct_text:
+        return direct_text
+
+    return cell.text(strip=True)
 
-    if direct_text_parts:
-        return " ".join(direct_text_parts)
 
-    return cell.get_text(strip=True)
+def _extract_cell_html_text(cell_html: str) -> str:
+    """Extract text from cell inner HTML ignoring nested element contents.
 
+    Mirrors _extract_cell_text for the regex tokenizer.
+    """
+    if "<" not in cell_html:
+        return unescape(cell_html).strip()
+
+    direct_text_parts: list[str] = []
+    depth = 0
+    pos = 0
+    for tag in _TAG_RE.finditer(cell_html):
+        if depth == 0:
+            direct_text_parts.append(cell_html[pos : tag.start()])
+        pos = tag.end()
+
+        closing, name = tag.groups()
+        name = name.lower()
+        if not name or name in _VOID_TAGS or tag.group(0).endswith("/>"):
+            continue
+        depth = max(depth - 1, 0) if closing else depth + 1
+
+    if depth == 0:
+        direct_text_parts.append(cell_html[pos:])
+
+    direct_text = " ".join(
+        part for part in (unescape(part).strip() for part in direct_text_parts) if part
+    )
+    if direct_text:
+        return direct_text
+
+    return unescape(_TAG_RE.sub("", cell_html)).strip()
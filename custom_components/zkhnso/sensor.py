@@ -2,25 +2,37 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from itertools import chain
 import logging
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
-from .api_client import ZKHAPIClient
+from .api_client import ZKHAPIClient, create_session
 from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(hours=1)
 
+# Meter units to device class and unit of measurement
+_UNITS_DEVICE_CLASS = {
+    "куб.м.": "water",
+}
+_UNITS_UOM = {
+    "куб.м.": "m³",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -45,53 +57,39 @@ async def async_setup_entry(
         coordinator.data = {"meters": {}, "tariffs": {}}
 
     # Create sensors dynamically based on meters and tariffs data
-    entities = []
-
-    # Create meter sensors
-    if coordinator.data and isinstance(coordinator.data, dict) and "meters" in coordinator.data:
-        meters = coordinator.data["meters"]
-        if meters and isinstance(meters, dict) and len(meters) > 0:
-            meter_entities = [
-                ZKHMeterSensor(coordinator, meter_key, meter_data)
-                for meter_key, meter_data in meters.items()
-            ]
-            entities.extend(meter_entities)
-            _LOGGER.info("Created %d meter sensors", len(meter_entities))
-        else:
-            _LOGGER.warning(
-                "Meters data is empty or invalid. Meters: %s (type: %s, len: %s)",
-                meters,
-                type(meters),
-                len(meters) if isinstance(meters, dict) else "N/A",
-            )
+    meters = (coordinator.data or {}).get("meters") or {}
+    tariffs = (coordinator.data or {}).get("tariffs") or {}
 
-    # Create tariff sensors
-    if coordinator.data and isinstance(coordinator.data, dict) and "tariffs" in coordinator.data:
-        tariffs = coordinator.data["tariffs"]
-        if tariffs and isinstance(tariffs, dict) and len(tariffs) > 0:
-            tariff_entities = [
-                ZKHTariffSensor(coordinator, tariff_key, tariff_data)
-                for tariff_key, tariff_data in tariffs.items()
-            ]
-            entities.extend(tariff_entities)
-            _LOGGER.info("Created %d tariff sensors", len(tariff_entities))
-        else:
-            _LOGGER.warning(
-                "Tariffs data is empty or invalid. Tariffs: %s (type: %s, len: %s)",
-                tariffs,
-                type(tariffs),
-                len(tariffs) if isinstance(tariffs, dict) else "N/A",
-            )
+    if meters:
+        _LOGGER.info("Created %d meter sensors", len(meters))
+    else:
+        _LOGGER.warning("Meters data is empty, no meter sensors created")
 
-    if entities:
-        async_add_entities(entities, update_before_add=False)
-        _LOGGER.info("Total sensors created: %d", len(entities))
+    if tariffs:
+        _LOGGER.info("Created %d tariff sensors", len(tariffs))
+    else:
+        _LOGGER.warning("Tariffs data is empty, no tariff sensors created")
+
+    if meters or tariffs:
+        async_add_entities(
+            chain(
+                (
+                    ZKHMeterSensor(coordinator, meter_key, meter_data)
+                    for meter_key, meter_data in meters.items()
+                ),
+                (
+                    ZKHTariffSensor(coordinator, tariff_key, tariff_data)
+                    for tariff_key, tariff_data in tariffs.items()
+                ),
+            ),
+            update_before_add=False,
+        )
+        _LOGGER.info("Total sensors created: %d", len(meters) + len(tariffs))
     else:
         _LOGGER.error(
-            "No sensors created. Coordinator data: %s (type: %s). "
+            "No sensors created. Coordinator data: %r. "
             "This might indicate an API issue. Check logs for errors.",
             coordinator.data,
-            type(coordinator.data) if coordinator.data else None,
         )
 
 
@@ -105,71 +103,132 @@ class ZKHDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            # Readings rarely change between polls, skip no-op state writes
+            always_update=False,
         )
         self.entry = entry
         self.username = entry.data[CONF_USERNAME]
         self.password = entry.data[CONF_PASSWORD]
+        # Dedicated session so the portal cookies stay out of the shared jar
+        self.session = create_session()
+        # Config entries are not unloaded on stop, close on shutdown as well
+        entry.async_on_unload(self.session.close)
+        entry.async_on_unload(
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, self._async_close_session
+            )
+        )
+        self._client: ZKHAPIClient | None = None
+        self._meters_by_key: dict[str, dict[str, Any]] = {}
+        self._tariffs_by_key: dict[str, dict[str, Any]] = {}
+
+    async def _async_close_session(self, event: Event) -> None:
+        """Close the HTTP session when Home Assistant shuts down."""
+        await self.session.close()
+
+    def get_meter(self, key: str) -> dict[str, Any] | None:
+        """Return the meter with the given key from the latest data."""
+        return self._meters_by_key.get(key)
+
+    def get_tariff(self, key: str) -> dict[str, Any] | None:
+        """Return the tariff with the given key from the latest data."""
+        return self._tariffs_by_key.get(key)
+
+    @callback
+    def async_set_meter_value(self, key: str, value: int | float) -> None:
+        """Update a meter value locally and notify entities without polling."""
+        if not self.data or key not in self.data["meters"]:
+            raise HomeAssistantError(f"Unknown ZKH meter: {key}")
+
+        meters = self.data["meters"]
+        # Copy instead of mutating, listeners may still hold the previous data
+        new_meters = {**meters, key: {**meters[key], "value": float(value)}}
+        self._meters_by_key = new_meters
+        self.async_set_updated_data({**self.data, "meters": new_meters})
 
     async def _async_update_data(self):
         """Fetch data from ZKH."""
-        try:
-            async with ZKHAPIClient(self.username, self.password) as client:
-                # Perform preflight to get FORM_TOKEN and JSESSIONID
-                _LOGGER.debug("Starting preflight request")
-                preflight_result = await client.preflight()
-                if not preflight_result:
-                    _LOGGER.error("Preflight request failed")
-                    raise Exception("Failed to perform preflight request")
-
-                _LOGGER.debug("Preflight successful, session initialized")
-
-                # Perform login
-                _LOGGER.debug("Starting login")
-                login_success = await client.login()
-                if not login_success:
-                    _LOGGER.error("Login failed")
-                    raise Exception("Failed to login")
-
-                _LOGGER.debug("Login successful")
-
-                # Fetch meters data
-                _LOGGER.debug("Fetching meters data")
-                meters_data = await client.get_meters()
-                if not meters_data:
-                    _LOGGER.error("Failed to fetch meters data")
-                    raise Exception("Failed to fetch meters data")
-
-                meters_count = len(meters_data.get("meters", {}))
-                _LOGGER.info("Fetched %d meters", meters_count)
-
-                if meters_count == 0:
-                    _LOGGER.warning("No meters found in response")
-
-                # Fetch tariffs data
-                _LOGGER.debug("Fetching tariffs data")
-                tariffs_data = await client.get_tariffs()
-                if not tariffs_data:
-                    _LOGGER.warning("Failed to fetch tariffs data, continuing without it")
-                    tariffs_data = {"tariffs": {}}
-
-                tariffs_count = len(tariffs_data.get("tariffs", {}))
-                _LOGGER.info("Fetched %d tariffs", tariffs_count)
-
-                # Combine data
-                combined_data = {
-                    **meters_data,
-                    **tariffs_data,
-                }
-
-                return combined_data
-        except Exception as e:
-            _LOGGER.error("Error updating ZKH data: %s", e, exc_info=True)
-            raise
+        # Keep one client across polls so its session and cookies are reused
+        if self._client is None:
+            self._client = ZKHAPIClient(self.username, self.password, self.session)
+
+        # Log in only when there is no session yet, the client logs in
+        # again by itself once the session expires
+        if not self._client.jsessionid:
+            # Perform preflight to get FORM_TOKEN and JSESSIONID
+            _LOGGER.debug("Starting preflight request")
+            preflight_result = await self._client.preflight()
+            if not preflight_result:
+                raise UpdateFailed("Failed to perform preflight request")
+
+            _LOGGER.debug("Preflight successful, session initialized")
+
+            # Perform login
+            _LOGGER.debug("Starting login")
+            login_success = await self._client.login()
+            if not login_success:
+                raise UpdateFailed("Failed to login")
+
+            _LOGGER.debug("Login successful")
+
+        # Fetch meters and tariffs data concurrently; meters are required,
+        # tariffs are optional
+        _LOGGER.debug("Fetching meters and tariffs data")
+        results = await self._client.get_all()
+
+        meters_data = results["meters"]
+        if not meters_data:
+            raise UpdateFailed("Failed to fetch meters data")
+
+        meters_count = len(meters_data.get("meters", {}))
+        _LOGGER.info("Fetched %d meters", meters_count)
+
+        if meters_count == 0:
+            _LOGGER.warning("No meters found in response")
+
+        tariffs_data = results["tariffs"]
+        if not tariffs_data:
+            _LOGGER.warning("Failed to fetch tariffs data, continuing without it")
+            tariffs_data = {"tariffs": {}}
+
+        tariffs_count = len(tariffs_data.get("tariffs", {}))
+        _LOGGER.info("Fetched %d tariffs", tariffs_count)
+
+        # Keep only what entities use, so comparing polls stays cheap
+        combined_data = {
+            "meters": meters_data.get("meters", {}),
+            "tariffs": tariffs_data.get("tariffs", {}),
+        }
+
+        # Normalize state values once here instead of on every entity update
+        for meter in combined_data["meters"].values():
+            meter["value"] = float(meter.get("value") or 0)
+        for tariff in combined_data["tariffs"].values():
+            if tariff.get("tariff") is not None:
+                tariff["tariff"] = float(tariff["tariff"])
+
+        # Index once per update for the per-entity lookups
+        self._meters_by_key = combined_data["meters"]
+        self._tariffs_by_key = combined_data["tariffs"]
+
+        return combined_data
 
 
 class ZKHMeterSensor(CoordinatorEntity, SensorEntity):
     """Representation of a ZKH meter sensor."""
 
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    # Meter fields exposed as state attributes
+    _row_keys = (
+        "serial_number",
+        "units",
+        "type_name",
+        "value_date",
+        "next_verification_date",
+    )
+
     def __init__(
         self,
         coordinator: ZKHDataUpdateCoordinator,
@@ -179,57 +238,38 @@ class ZKHMeterSensor(CoordinatorEntity, SensorEntity):
         """Initialize the meter sensor."""
         super().__init__(coordinator)
 
-        units_to_device_class = {
-            "куб.м.": "water",
-        }
-
-        units_to_measurement = {
-            "куб.м.": "m³",
-        }
-
         self.meter_key = meter_key
         self._attr_unique_id = f"{self.coordinator.entry.entry_id}_meter_{meter_key}"
         self._attr_name = meter_data.get("name", f"Meter {meter_key}")
-        self._attr_device_class = units_to_device_class.get(meter_data.get("units"), "energy")
+        self._attr_device_class = _UNITS_DEVICE_CLASS.get(meter_data.get("units"), "energy")
         self._attr_state_class = "total_increasing"
         self._attr_icon = "mdi:counter"
-        self._attr_native_unit_of_measurement = units_to_measurement.get(meter_data.get("units"), "None")
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor (meter value)."""
-        if not self.coordinator.data or "meters" not in self.coordinator.data:
-            return None
-
-        meters = self.coordinator.data["meters"]
-        meter = meters.get(self.meter_key)
-        if meter:
-            return float(meter.get("value", 0))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data or "meters" not in self.coordinator.data:
-            return {}
-
-        meters = self.coordinator.data["meters"]
-        meter = meters.get(self.meter_key)
+        self._attr_native_unit_of_measurement = _UNITS_UOM.get(meter_data.get("units"), "None")
+        self._update_from_meter(meter_data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache state from the updated coordinator data."""
+        self._update_from_meter(self.coordinator.get_meter(self.meter_key))
+        super()._handle_coordinator_update()
+
+    def _update_from_meter(self, meter: dict[str, Any] | None) -> None:
+        """Set the state value (meter value) and attributes from a meter."""
         if not meter:
-            return {}
-
-        return {
-            "serial_number": meter.get("serial_number"),
-            "units": meter.get("units"),
-            "type_name": meter.get("type_name"),
-            "value_date": meter.get("value_date"),
-            "next_verification_date": meter.get("next_verification_date"),
-        }
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        self._attr_native_value = meter["value"]
+        self._attr_extra_state_attributes = {key: meter.get(key) for key in self._row_keys}
 
 
 class ZKHTariffSensor(CoordinatorEntity, SensorEntity):
     """Representation of a ZKH tariff sensor."""
 
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
     def __init__(
         self,
         coordinator: ZKHDataUpdateCoordinator,
@@ -245,31 +285,24 @@ class ZKHTariffSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = f"{tariff_data.get('unit', '')}/руб" if tariff_data.get('unit') else "руб"
         self._attr_state_class = None  # Tariffs are not measured values
         self._attr_icon = "mdi:currency-rub"
+        self._update_from_tariff(tariff_data)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache state from the updated coordinator data."""
+        self._update_from_tariff(self.coordinator.get_tariff(self.tariff_key))
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor (tariff value)."""
-        if not self.coordinator.data or "tariffs" not in self.coordinator.data:
-            return None
-
-        tariffs = self.coordinator.data["tariffs"]
-        tariff = tariffs.get(self.tariff_key)
-        if tariff:
-            return float(tariff.get("tariff", 0))
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        if not self.coordinator.data or "tariffs" not in self.coordinator.data:
-            return {}
-
-        tariffs = self.coordinator.data["tariffs"]
-        tariff = tariffs.get(self.tariff_key)
+    def _update_from_tariff(self, tariff: dict[str, Any] | None) -> None:
+        """Set the state value (tariff value) and attributes from a tariff."""
         if not tariff:
-            return {}
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
 
-        return {
+        # Tariff is None when the portal value could not be parsed
+        self._attr_native_value = tariff.get("tariff")
+        self._attr_extra_state_attributes = {
             "name": tariff.get("name"),
             "rate": tariff.get("rate"),
             "unit": tariff.get("unit"),